@@ -262,28 +262,42 @@ def save_user_anomaly(
     db_path: str
 ) -> None:
     """Save user anomaly to database."""
+    save_user_anomalies([anomaly], db_path)
+
+
+def save_user_anomalies(
+    anomalies: List[UserAnomaly],
+    db_path: str
+) -> None:
+    """Save several user anomalies to the database in one transaction."""
+    if not anomalies:
+        return
+    
     create_anomaly_detection_tables(db_path)
     
     with get_connection(db_path) as conn:
         cursor = conn.cursor()
         
-        cursor.execute("""
+        cursor.executemany("""
             INSERT OR REPLACE INTO user_anomalies 
             (anomaly_id, user_id, anomaly_type, severity, description, detected_at, 
              baseline_value, current_value, deviation_percentage, metadata)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            anomaly.anomaly_id,
-            anomaly.user_id,
-            anomaly.anomaly_type.value,
-            anomaly.severity.value,
-            anomaly.description,
-            anomaly.detected_at.isoformat(),
-            anomaly.baseline_value,
-            anomaly.current_value,
-            anomaly.deviation_percentage,
-            str(anomaly.metadata) if anomaly.metadata else None
-        ))
+        """, [
+            (
+                anomaly.anomaly_id,
+                anomaly.user_id,
+                anomaly.anomaly_type.value,
+                anomaly.severity.value,
+                anomaly.description,
+                anomaly.detected_at.isoformat(),
+                anomaly.baseline_value,
+                anomaly.current_value,
+                anomaly.deviation_percentage,
+                str(anomaly.metadata) if anomaly.metadata else None
+            )
+            for anomaly in anomalies
+        ])
         
         conn.commit()
 
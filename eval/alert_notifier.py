@@ -15,9 +15,28 @@ from enum import Enum
 import json
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Webhook calls reuse pooled keep-alive connections; sized for the concurrent
+# per-channel sends in send_alert_notification
+HTTP_POOL_MAXSIZE = 8
+
+
+@lru_cache(maxsize=None)
+def _get_http_session():
+    """Get the shared requests session (raises ImportError without requests)."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class NotificationChannel(str, Enum):
     """Notification channels for alerts."""
@@ -100,7 +119,7 @@ def send_slack_alert(alert: Dict[str, Any], config: AlertConfig) -> bool:
         True if successful, False otherwise
     """
     try:
-        import requests
+        session = _get_http_session()
         
         if not config.webhook_url:
             logger.warning("Slack webhook URL not configured")
@@ -151,7 +170,7 @@ def send_slack_alert(alert: Dict[str, Any], config: AlertConfig) -> bool:
                 "short": False
             })
         
-        response = requests.post(
+        response = session.post(
             config.webhook_url,
             json=slack_payload,
             timeout=10
@@ -251,7 +270,7 @@ def send_pagerduty_alert(alert: Dict[str, Any], config: AlertConfig) -> bool:
         True if successful, False otherwise
     """
     try:
-        import requests
+        session = _get_http_session()
         
         if not config.pagerduty_service_key:
             logger.warning("PagerDuty service key not configured")
@@ -286,7 +305,7 @@ def send_pagerduty_alert(alert: Dict[str, Any], config: AlertConfig) -> bool:
             }
         }
         
-        response = requests.post(
+        response = session.post(
             "https://events.pagerduty.com/v2/enqueue",
             json=pagerduty_payload,
             headers={"Content-Type": "application/json"},
@@ -308,6 +327,40 @@ def send_pagerduty_alert(alert: Dict[str, Any], config: AlertConfig) -> bool:
         return False
 
 
+def _send_channel_notification(
+    alert: Dict[str, Any],
+    config: AlertConfig
+) -> Optional[AlertNotification]:
+    """Send an alert through one channel, or return None for an unknown channel."""
+    success = False
+    error_message = None
+    
+    try:
+        if config.channel == NotificationChannel.CONSOLE:
+            success = send_console_alert(alert, config)
+        elif config.channel == NotificationChannel.SLACK:
+            success = send_slack_alert(alert, config)
+        elif config.channel == NotificationChannel.EMAIL:
+            success = send_email_alert(alert, config)
+        elif config.channel == NotificationChannel.PAGERDUTY:
+            success = send_pagerduty_alert(alert, config)
+        else:
+            logger.warning(f"Unknown notification channel: {config.channel}")
+            return None
+            
+    except Exception as e:
+        error_message = str(e)
+        logger.error(f"Error sending {config.channel} notification: {e}")
+    
+    return AlertNotification(
+        alert_id=alert.get("alert_id", "unknown"),
+        channel=config.channel,
+        sent_at=datetime.now(),
+        success=success,
+        error_message=error_message
+    )
+
+
 def send_alert_notification(
     alert: Dict[str, Any],
     configs: List[AlertConfig]
@@ -315,6 +368,9 @@ def send_alert_notification(
     """
     Send alert notification via configured channels.
     
+    Channels are independent network calls, so several are sent
+    concurrently and the slowest one bounds the total time.
+    
     Args:
         alert: Alert dictionary
         configs: List of AlertConfig objects
@@ -322,45 +378,21 @@ def send_alert_notification(
     Returns:
         List of AlertNotification objects
     """
-    notifications = []
     alert_level = alert.get("level", "info")
+    active_configs = [
+        config for config in configs
+        if config.enabled and alert_level in config.severity_filter
+    ]
     
-    for config in configs:
-        if not config.enabled:
-            continue
-        
-        if alert_level not in config.severity_filter:
-            continue
-        
-        success = False
-        error_message = None
-        
-        try:
-            if config.channel == NotificationChannel.CONSOLE:
-                success = send_console_alert(alert, config)
-            elif config.channel == NotificationChannel.SLACK:
-                success = send_slack_alert(alert, config)
-            elif config.channel == NotificationChannel.EMAIL:
-                success = send_email_alert(alert, config)
-            elif config.channel == NotificationChannel.PAGERDUTY:
-                success = send_pagerduty_alert(alert, config)
-            else:
-                logger.warning(f"Unknown notification channel: {config.channel}")
-                continue
-                
-        except Exception as e:
-            error_message = str(e)
-            logger.error(f"Error sending {config.channel} notification: {e}")
-        
-        notifications.append(AlertNotification(
-            alert_id=alert.get("alert_id", "unknown"),
-            channel=config.channel,
-            sent_at=datetime.now(),
-            success=success,
-            error_message=error_message
-        ))
+    if len(active_configs) > 1:
+        with ThreadPoolExecutor(max_workers=len(active_configs)) as executor:
+            results = list(executor.map(
+                lambda config: _send_channel_notification(alert, config), active_configs
+            ))
+    else:
+        results = [_send_channel_notification(alert, config) for config in active_configs]
     
-    return notifications
+    return [notification for notification in results if notification is not None]
 
 
 def load_alert_configs() -> List[AlertConfig]:
@@ -11,10 +11,11 @@ Measure impact of recommendations:
 - ROI calculation for partner offers
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Sequence, Tuple
 from datetime import datetime, date, timedelta
 from dataclasses import dataclass, field
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from ingest.database import get_connection
 
@@ -143,6 +144,10 @@ def create_effectiveness_tables(db_path: str) -> None:
         cursor.execute(
             f"CREATE INDEX IF NOT EXISTS idx_{ENGAGEMENT_TABLE}_offer ON {ENGAGEMENT_TABLE}(offer_id)"
         )
+        cursor.execute(
+            f"CREATE INDEX IF NOT EXISTS idx_{ENGAGEMENT_TABLE}_created_date "
+            f"ON {ENGAGEMENT_TABLE}(DATE(created_at), recommendation_id)"
+        )
         cursor.execute(
             f"CREATE INDEX IF NOT EXISTS idx_{OUTCOME_TABLE}_rec ON {OUTCOME_TABLE}(recommendation_id)"
         )
@@ -473,7 +478,7 @@ def calculate_offer_roi(
 
 
 def generate_effectiveness_report(
-    user_ids: List[str],
+    user_ids: Sequence[str],
     db_path: str,
     report_id: Optional[str] = None
 ) -> EffectivenessReport:
@@ -600,21 +605,26 @@ def generate_effectiveness_report(
     # Offer performance
     offer_performance: List[OfferPerformance] = []
     offer_ids = {metric.offer_id for metric in engagement_metrics if metric.offer_id}
-    with get_connection(db_path) as conn:
-        cursor = conn.cursor()
-        for offer_id in offer_ids:
+    if offer_ids:
+        # One grouped query for all offers instead of one query per offer
+        with get_connection(db_path) as conn:
+            cursor = conn.cursor()
             cursor.execute(
                 f"""
                 SELECT
+                    offer_id,
                     SUM(CASE WHEN action='view' THEN 1 ELSE 0 END) AS views,
                     SUM(CASE WHEN action='click' THEN 1 ELSE 0 END) AS clicks,
                     SUM(CASE WHEN action='complete' THEN 1 ELSE 0 END) AS conversions
                 FROM {ENGAGEMENT_TABLE}
-                WHERE offer_id = ?
-                """,
-                (offer_id,)
+                WHERE offer_id IS NOT NULL
+                GROUP BY offer_id
+                """
             )
-            views, clicks, conversions = cursor.fetchone()
+            offer_counts = {row[0]: row[1:] for row in cursor.fetchall()}
+
+        for offer_id in offer_ids:
+            views, clicks, conversions = offer_counts.get(offer_id, (0, 0, 0))
             offer_performance.append(
                 calculate_offer_roi(
                     offer_id=offer_id,
@@ -640,52 +650,80 @@ def generate_effectiveness_report(
     )
 
 
-def _generate_mock_effectiveness_report(
-    user_ids: List[str],
-    db_path: str,
-    report_id: str
-) -> EffectivenessReport:
-    """Fallback report generation using simulated data."""
+MOCK_REPORT_MAX_USERS = 3
+MOCK_REPORT_MAX_WORKERS = 8
+
+
+def _mock_metrics_for_user(
+    user_id: str,
+    db_path: str
+) -> Tuple[List[EngagementMetrics], List[OutcomeMetrics]]:
+    """Simulate engagement and outcomes for one user's recommendations."""
     engagement_metrics: List[EngagementMetrics] = []
     outcome_metrics: List[OutcomeMetrics] = []
 
-    for user_id in user_ids[:3]:
-        try:
-            persona_assignment = assign_personas_with_prioritization(user_id, db_path)
-            if not persona_assignment.primary_persona:
-                continue
+    try:
+        persona_assignment = assign_personas_with_prioritization(user_id, db_path)
+        if not persona_assignment.primary_persona:
+            return engagement_metrics, outcome_metrics
+
+        recommendations = build_recommendations(
+            user_id,
+            db_path,
+            persona_assignment,
+            check_consent=False
+        )
 
-            recommendations = build_recommendations(
+        for item in recommendations.education_items:
+            metrics = EngagementMetrics(
+                recommendation_id=item.recommendation_id,
+                user_id=user_id,
+                views=1,
+                clicks=1,
+                completions=1,
+                click_through_rate=100.0,
+                completion_rate=100.0,
+                average_time_spent=300.0
+            )
+            engagement_metrics.append(metrics)
+
+            outcome = track_outcome(
                 user_id,
+                item.recommendation_id,
                 db_path,
-                persona_assignment,
-                check_consent=False
+                "utilization_improved",
+                metadata={"content_id": item.content_id}
             )
+            if outcome:
+                outcome_metrics.append(outcome)
+    except Exception:
+        pass
 
-            for item in recommendations.education_items:
-                metrics = EngagementMetrics(
-                    recommendation_id=item.recommendation_id,
-                    user_id=user_id,
-                    views=1,
-                    clicks=1,
-                    completions=1,
-                    click_through_rate=100.0,
-                    completion_rate=100.0,
-                    average_time_spent=300.0
-                )
-                engagement_metrics.append(metrics)
+    return engagement_metrics, outcome_metrics
 
-                outcome = track_outcome(
-                    user_id,
-                    item.recommendation_id,
-                    db_path,
-                    "utilization_improved",
-                    metadata={"content_id": item.content_id}
-                )
-                if outcome:
-                    outcome_metrics.append(outcome)
-        except Exception:
-            continue
+
+def _generate_mock_effectiveness_report(
+    user_ids: Sequence[str],
+    db_path: str,
+    report_id: str
+) -> EffectivenessReport:
+    """
+    Fallback report generation using simulated data.
+    
+    Users are independent, so they are simulated in a small thread pool; each
+    worker thread uses its own pooled database connection.
+    """
+    engagement_metrics: List[EngagementMetrics] = []
+    outcome_metrics: List[OutcomeMetrics] = []
+
+    sample_ids = list(user_ids[:MOCK_REPORT_MAX_USERS])
+    if sample_ids:
+        with ThreadPoolExecutor(max_workers=min(len(sample_ids), MOCK_REPORT_MAX_WORKERS)) as executor:
+            for user_engagement, user_outcomes in executor.map(
+                lambda user_id: _mock_metrics_for_user(user_id, db_path), sample_ids
+            ):
+                engagement_metrics.extend(user_engagement)
+                outcome_metrics.extend(user_outcomes)
 
     content_ids = {
         metric.content_id or metric.recommendation_id.split('-')[-1]
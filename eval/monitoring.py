@@ -11,7 +11,8 @@ Detect system issues in production:
 - Dashboard for system health
 """
 
-from typing import List, Dict, Optional, Any
+import os
+from typing import List, Dict, Optional, Any, Sequence
 from datetime import datetime, date, timedelta
 from dataclasses import dataclass
 from collections import defaultdict
@@ -47,6 +48,8 @@ class PerformanceMetrics:
     throughput: float  # requests per second
     error_rate: float  # percentage of errors
     active_users: int
+    latency_p90: float = 0.0  # 90th percentile latency
+    latency_p999: float = 0.0  # 99.9th percentile latency
 
 
 @dataclass
@@ -92,12 +95,57 @@ class SystemHealth:
             self.anomaly_alerts = []
 
 
-def check_database_health(db_path: str) -> HealthCheck:
+def collect_table_stats(db_path: str) -> Dict[str, int]:
+    """
+    Collect row counts and data-quality counters in one pass per table.
+    
+    Args:
+        db_path: Path to SQLite database
+        
+    Returns:
+        Dictionary of counters used by the database and data-quality checks
+    """
+    with get_connection(db_path) as conn:
+        cursor = conn.cursor()
+        
+        cursor.execute("""
+            SELECT
+                COUNT(*),
+                SUM(CASE WHEN a.balances_current IS NULL THEN 1 ELSE 0 END),
+                SUM(CASE WHEN NOT EXISTS (
+                    SELECT 1 FROM transactions t WHERE t.account_id = a.account_id
+                ) THEN 1 ELSE 0 END)
+            FROM accounts a
+        """)
+        account_count, missing_balances, accounts_without_transactions = cursor.fetchone()
+        
+        cursor.execute("""
+            SELECT
+                COUNT(*),
+                SUM(CASE WHEN NOT EXISTS (
+                    SELECT 1 FROM accounts a WHERE a.account_id = t.account_id
+                ) THEN 1 ELSE 0 END)
+            FROM transactions t
+        """)
+        transaction_count, orphaned_transactions = cursor.fetchone()
+    
+    return {
+        "account_count": account_count,
+        "transaction_count": transaction_count,
+        "missing_balances": missing_balances or 0,
+        "accounts_without_transactions": accounts_without_transactions or 0,
+        "orphaned_transactions": orphaned_transactions or 0
+    }
+
+
+def check_database_health(db_path: str, stats: Optional[Dict[str, int]] = None) -> HealthCheck:
     """
     Check database health.
     
     Args:
         db_path: Path to SQLite database
+        stats: Optional counters from collect_table_stats; without them only
+            the row counts are queried
         
     Returns:
         HealthCheck object
@@ -114,24 +162,23 @@ def check_database_health(db_path: str) -> HealthCheck:
             )
         
         # Check database connection
-        with get_connection(db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM accounts")
-            account_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM transactions")
-            transaction_count = cursor.fetchone()[0]
-            
-            return HealthCheck(
-                component="database",
-                status="healthy",
-                message="Database connection successful",
-                timestamp=datetime.now(),
-                metrics={
-                    "account_count": account_count,
-                    "transaction_count": transaction_count
-                }
-            )
+        if stats is None:
+            with get_connection(db_path) as conn:
+                account_count, transaction_count = conn.execute("""
+                    SELECT (SELECT COUNT(*) FROM accounts), (SELECT COUNT(*) FROM transactions)
+                """).fetchone()
+            stats = {"account_count": account_count, "transaction_count": transaction_count}
+        
+        return HealthCheck(
+            component="database",
+            status="healthy",
+            message="Database connection successful",
+            timestamp=datetime.now(),
+            metrics={
+                "account_count": stats["account_count"],
+                "transaction_count": stats["transaction_count"]
+            }
+        )
     except Exception as e:
         return HealthCheck(
             component="database",
@@ -141,12 +188,13 @@ def check_database_health(db_path: str) -> HealthCheck:
         )
 
 
-def check_data_quality(db_path: str) -> List[DataQualityAlert]:
+def check_data_quality(db_path: str, stats: Optional[Dict[str, int]] = None) -> List[DataQualityAlert]:
     """
     Check data quality and return alerts.
     
     Args:
         db_path: Path to SQLite database
+        stats: Optional counters from collect_table_stats (queried if not provided)
         
     Returns:
         List of DataQualityAlert objects
@@ -154,61 +202,47 @@ def check_data_quality(db_path: str) -> List[DataQualityAlert]:
     alerts = []
     
     try:
-        with get_connection(db_path) as conn:
-            cursor = conn.cursor()
-            
-            # Check for orphaned transactions
-            cursor.execute("""
-                SELECT COUNT(*) FROM transactions t
-                LEFT JOIN accounts a ON t.account_id = a.account_id
-                WHERE a.account_id IS NULL
-            """)
-            orphaned_count = cursor.fetchone()[0]
-            
-            if orphaned_count > 0:
-                alerts.append(DataQualityAlert(
-                    alert_id=f"DQ-{datetime.now().strftime('%Y%m%d%H%M%S')}",
-                    alert_type="orphaned_records",
-                    severity="high",
-                    message=f"Found {orphaned_count} orphaned transactions",
-                    timestamp=datetime.now(),
-                    affected_count=orphaned_count
-                ))
-            
-            # Check for missing account balances
-            cursor.execute("""
-                SELECT COUNT(*) FROM accounts
-                WHERE balances_current IS NULL
-            """)
-            missing_balances = cursor.fetchone()[0]
-            
-            if missing_balances > 0:
-                alerts.append(DataQualityAlert(
-                    alert_id=f"DQ-{datetime.now().strftime('%Y%m%d%H%M%S')}-2",
-                    alert_type="missing_data",
-                    severity="medium",
-                    message=f"Found {missing_balances} accounts with missing balances",
-                    timestamp=datetime.now(),
-                    affected_count=missing_balances
-                ))
-            
-            # Check for accounts without transactions (could be new accounts)
-            cursor.execute("""
-                SELECT a.account_id FROM accounts a
-                LEFT JOIN transactions t ON a.account_id = t.account_id
-                WHERE t.transaction_id IS NULL
-            """)
-            accounts_without_transactions = len(cursor.fetchall())
-            
-            if accounts_without_transactions > 10:  # Threshold
-                alerts.append(DataQualityAlert(
-                    alert_id=f"DQ-{datetime.now().strftime('%Y%m%d%H%M%S')}-3",
-                    alert_type="missing_transactions",
-                    severity="low",
-                    message=f"Found {accounts_without_transactions} accounts without transactions (may be new accounts)",
-                    timestamp=datetime.now(),
-                    affected_count=accounts_without_transactions
-                ))
+        if stats is None:
+            stats = collect_table_stats(db_path)
+        
+        # Check for orphaned transactions
+        orphaned_count = stats["orphaned_transactions"]
+        
+        if orphaned_count > 0:
+            alerts.append(DataQualityAlert(
+                alert_id=f"DQ-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+                alert_type="orphaned_records",
+                severity="high",
+                message=f"Found {orphaned_count} orphaned transactions",
+                timestamp=datetime.now(),
+                affected_count=orphaned_count
+            ))
+        
+        # Check for missing account balances
+        missing_balances = stats["missing_balances"]
+        
+        if missing_balances > 0:
+            alerts.append(DataQualityAlert(
+                alert_id=f"DQ-{datetime.now().strftime('%Y%m%d%H%M%S')}-2",
+                alert_type="missing_data",
+                severity="medium",
+                message=f"Found {missing_balances} accounts with missing balances",
+                timestamp=datetime.now(),
+                affected_count=missing_balances
+            ))
+        
+        # Check for accounts without transactions (could be new accounts)
+        accounts_without_transactions = stats["accounts_without_transactions"]
+        
+        if accounts_without_transactions > 10:  # Threshold
+            alerts.append(DataQualityAlert(
+                alert_id=f"DQ-{datetime.now().strftime('%Y%m%d%H%M%S')}-3",
+                alert_type="missing_transactions",
+                severity="low",
+                message=f"Found {accounts_without_transactions} accounts without transactions (may be new accounts)",
+                timestamp=datetime.now(),
+                affected_count=accounts_without_transactions
+            ))
     
     except Exception as e:
         alerts.append(DataQualityAlert(
@@ -224,7 +258,7 @@ def check_data_quality(db_path: str) -> List[DataQualityAlert]:
 
 
 def detect_persona_distribution_anomaly(
-    user_ids: List[str],
+    user_ids: Sequence[str],
     db_path: str,
     baseline_distribution: Optional[Dict[str, float]] = None
 ) -> Optional[AnomalyAlert]:
@@ -287,7 +321,7 @@ def detect_persona_distribution_anomaly(
 
 
 def monitor_performance(
-    user_ids: List[str],
+    user_ids: Sequence[str],
     db_path: str
 ) -> PerformanceMetrics:
     """
@@ -322,14 +356,15 @@ def monitor_performance(
             total_requests += 1
     
     if latencies:
+        # Sort once and read every percentile by index
         sorted_latencies = sorted(latencies)
         n = len(sorted_latencies)
         
-        latency_p50 = sorted_latencies[n // 2]
-        latency_p95 = sorted_latencies[int(n * 0.95)] if n > 1 else sorted_latencies[0]
-        latency_p99 = sorted_latencies[int(n * 0.99)] if n > 1 else sorted_latencies[0]
+        latency_p50, latency_p90, latency_p95, latency_p99, latency_p999 = (
+            sorted_latencies[int(n * fraction)] for fraction in (0.50, 0.90, 0.95, 0.99, 0.999)
+        )
     else:
-        latency_p50 = latency_p95 = latency_p99 = 0.0
+        latency_p50 = latency_p90 = latency_p95 = latency_p99 = latency_p999 = 0.0
     
     total_time = sum(latencies) if latencies else 1.0
     throughput = total_requests / total_time if total_time > 0 else 0.0
@@ -342,12 +377,14 @@ def monitor_performance(
         latency_p99=latency_p99,
         throughput=throughput,
         error_rate=error_rate,
-        active_users=len(user_ids)
+        active_users=len(user_ids),
+        latency_p90=latency_p90,
+        latency_p999=latency_p999
     )
 
 
 def check_system_health(
-    user_ids: List[str],
+    user_ids: Sequence[str],
     db_path: str,
     send_notifications: bool = True
 ) -> SystemHealth:
@@ -364,12 +401,19 @@ def check_system_health(
     """
     health_checks = []
     
-    # Database health
-    db_health = check_database_health(db_path)
+    # Database health and data quality share one set of table scans
+    table_stats = None  # On failure each check queries and reports its own error
+    if os.path.exists(db_path):
+        try:
+            table_stats = collect_table_stats(db_path)
+        except Exception:
+            pass
+    
+    db_health = check_database_health(db_path, stats=table_stats)
     health_checks.append(db_health)
     
     # Data quality
-    data_quality_alerts = check_data_quality(db_path)
+    data_quality_alerts = check_data_quality(db_path, stats=table_stats)
     
     # Performance monitoring
     performance_metrics = monitor_performance(user_ids, db_path)
@@ -518,8 +562,10 @@ HEALTH CHECKS
         report += "================================================================================\n"
         pm = system_health.performance_metrics
         report += f"  P50 Latency: {pm.latency_p50:.2f}s\n"
+        report += f"  P90 Latency: {pm.latency_p90:.2f}s\n"
         report += f"  P95 Latency: {pm.latency_p95:.2f}s\n"
         report += f"  P99 Latency: {pm.latency_p99:.2f}s\n"
+        report += f"  P99.9 Latency: {pm.latency_p999:.2f}s\n"
         report += f"  Throughput: {pm.throughput:.2f} requests/second\n"
         report += f"  Error Rate: {pm.error_rate:.1f}%\n"
         report += f"  Active Users: {pm.active_users}\n"
@@ -154,10 +154,11 @@ def calculate_income_variability(amounts: List[float]) -> float:
     if len(amounts) < 2:
         return 0.0
     
-    if mean(amounts) == 0:
+    average = mean(amounts)
+    if average == 0:
         return 1.0
     
-    return stdev(amounts) / mean(amounts)
+    return stdev(amounts, xbar=average) / average
 
 
 def calculate_median_pay_gap(transactions: List) -> float:
@@ -388,16 +389,7 @@ def analyze_income_stability_for_customer(
     # Calculate income variability from primary pattern
     payroll_patterns = [p for p in income_patterns if p.source_name == "Payroll"]
     if payroll_patterns:
-        # Get all payroll amounts to calculate variability
-        all_transactions = []
-        for account in checking_accounts:
-            transactions = get_transactions_by_account(
-                account.account_id, db_path,
-                start_date=window_start_date,
-                end_date=window_end_date
-            )
-            all_transactions.extend(transactions)
-        
+        # Reuse the window's transactions already loaded above
         payroll_deposits = [t for t in all_transactions if is_payroll_deposit(t)]
         payroll_amounts = [t.amount for t in payroll_deposits]
         income_variability = calculate_income_variability(payroll_amounts)
@@ -220,27 +220,28 @@ def detect_subscriptions(
     if not charge_transactions:
         return []
     
-    # Group by merchant
-    merchant_groups = group_transactions_by_merchant(charge_transactions)
-    
-    subscriptions = []
-    
     # Determine window end date (use latest transaction date)
     window_end_date = max(t.date for t in charge_transactions)
     window_start_date = window_end_date - timedelta(days=window_days)
     
-    for merchant_name, merchant_transactions in merchant_groups.items():
-        # Filter to window
-        window_transactions = [
-            t for t in merchant_transactions
-            if window_start_date <= t.date <= window_end_date
-        ]
-        
+    # Filter to window once, then group by merchant
+    merchant_groups = group_transactions_by_merchant([
+        t for t in charge_transactions
+        if window_start_date <= t.date <= window_end_date
+    ])
+    
+    subscriptions = []
+    
+    for merchant_name, window_transactions in merchant_groups.items():
         if len(window_transactions) < min_occurrences:
             continue
         
-        # Calculate intervals
-        intervals = calculate_date_intervals(window_transactions)
+        # Sort once; intervals and first/last dates all come from this order
+        sorted_dates = sorted(t.date for t in window_transactions)
+        intervals = [
+            (sorted_dates[i] - sorted_dates[i - 1]).days
+            for i in range(1, len(sorted_dates))
+        ]
         
         if not intervals:
             continue
@@ -263,9 +264,8 @@ def detect_subscriptions(
         )
         
         # Get dates
-        sorted_transactions = sorted(window_transactions, key=lambda t: t.date)
-        first_transaction_date = sorted_transactions[0].date
-        last_transaction_date = sorted_transactions[-1].date
+        first_transaction_date = sorted_dates[0]
+        last_transaction_date = sorted_dates[-1]
         
         # Check if active
         is_active = is_active_subscription(last_transaction_date, cadence, window_end_date)
@@ -377,7 +377,8 @@ def analyze_behavior_trends(
 
 def detect_early_warning_signals(
     user_id: str,
-    db_path: str
+    db_path: str,
+    trends: Optional[BehaviorTrends] = None
 ) -> List[str]:
     """
     Detect early warning signals for user.
@@ -385,6 +386,7 @@ def detect_early_warning_signals(
     Args:
         user_id: User ID
         db_path: Path to SQLite database
+        trends: Optional precomputed BehaviorTrends (analyzed if not provided)
         
     Returns:
         List of warning signals
@@ -392,23 +394,25 @@ def detect_early_warning_signals(
     warnings = []
     
     # Analyze trends
-    trends = analyze_behavior_trends(user_id, db_path)
+    if trends is None:
+        trends = analyze_behavior_trends(user_id, db_path)
     
     # Check for early warnings
     for trend_name, trend in trends.trends.items():
         if trend.early_warning:
             warnings.append(f"{trend_name.replace('_', ' ').title()}: {trend.predictive_signal or 'Trend detected'}")
     
-    # Check for specific warning conditions
-    card_metrics, agg_metrics = analyze_credit_utilization_for_customer(user_id, db_path, 30)
-    if card_metrics:
-        utilization = agg_metrics.aggregate_utilization
+    # Check for specific warning conditions. The first trend point is the
+    # current utilization / savings balance, so the analyzers are not re-run.
+    utilization_trend = trends.trends.get("credit_utilization")
+    if utilization_trend and utilization_trend.trend_points:
+        utilization = utilization_trend.trend_points[0].value
         if utilization > 80:
             warnings.append("High credit utilization (>80%) - risk to credit score")
     
-    savings_accounts, savings_metrics = analyze_savings_patterns_for_customer(user_id, db_path, 180)
-    if savings_accounts:
-        balance = savings_metrics.total_savings_balance
+    savings_trend = trends.trends.get("savings_balance")
+    if savings_trend and savings_trend.trend_points:
+        balance = savings_trend.trend_points[0].value
         if balance < 500:
             warnings.append("Low savings balance (<$500) - insufficient emergency fund")
     
@@ -13,6 +13,9 @@ const queryClient = new QueryClient({
     queries: {
       refetchOnWindowFocus: false,
       retry: 1,
+      // Reuse fetched profiles/recommendations when revisiting a page; the API
+      // caches persona and signal results for about as long
+      staleTime: 60_000,
     },
   },
 });
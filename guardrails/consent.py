@@ -14,23 +14,21 @@ from typing import Optional, List, Dict
 from datetime import datetime, date, timedelta
 from dataclasses import dataclass
 from enum import Enum
-import sqlite3
 from contextlib import contextmanager
 
+from ingest.database import get_pooled_connection
+
 
 @contextmanager
 def get_connection(db_path: str):
-    """Get database connection context manager."""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    """Get a pooled database connection context manager."""
+    conn = get_pooled_connection(db_path)
     try:
         yield conn
         conn.commit()
     except Exception:
         conn.rollback()
         raise
-    finally:
-        conn.close()
 
 
 class ConsentStatus(str, Enum):
@@ -125,6 +123,11 @@ def create_consent_tables(db_path: str) -> None:
             ON consent(user_id, status)
         """)
         
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_consent_granted_date 
+            ON consent(DATE(granted_at), status)
+        """)
+        
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_consent_audit_user 
             ON consent_audit(user_id, timestamp)
@@ -217,6 +220,81 @@ def grant_consent(
     return consent_record
 
 
+def grant_consent_bulk(
+    user_ids: List[str],
+    db_path: str,
+    scope: ConsentScope = ConsentScope.ALL,
+    expires_at: Optional[datetime] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+    notes: Optional[str] = None
+) -> int:
+    """
+    Grant consent to many users in a single transaction.
+    
+    Equivalent to calling grant_consent for each user, but previous statuses
+    are read with one query and the consent and audit rows are written with
+    executemany.
+    
+    Args:
+        user_ids: User IDs to grant consent to
+        db_path: Path to SQLite database
+        scope: Consent scope (default: ALL)
+        expires_at: Optional expiration datetime
+        ip_address: Optional IP address
+        user_agent: Optional user agent string
+        notes: Optional notes
+        
+    Returns:
+        Number of users granted consent
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return 0
+    
+    granted_at = datetime.now().isoformat()
+    expires = expires_at.isoformat() if expires_at else None
+    
+    with get_connection(db_path) as conn:
+        cursor = conn.cursor()
+        
+        # Previous statuses for the audit trail, with lapsed grants reported as expired
+        cursor.execute("""
+            SELECT user_id, status, expires_at FROM consent WHERE scope = ?
+        """, (scope.value,))
+        previous_statuses = {}
+        for row in cursor.fetchall():
+            status = row['status']
+            if (status == ConsentStatus.ACTIVE.value and row['expires_at']
+                    and row['expires_at'] < granted_at):
+                status = ConsentStatus.EXPIRED.value
+            previous_statuses[row['user_id']] = status
+        
+        cursor.executemany("""
+            INSERT OR REPLACE INTO consent 
+            (user_id, status, scope, granted_at, revoked_at, expires_at, ip_address, user_agent, notes)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (user_id, ConsentStatus.ACTIVE.value, scope.value, granted_at, None,
+             expires, ip_address, user_agent, notes)
+            for user_id in user_ids
+        ])
+        
+        cursor.executemany("""
+            INSERT INTO consent_audit 
+            (user_id, action, timestamp, previous_status, new_status, scope, ip_address, user_agent, notes)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (user_id, 'granted', granted_at, previous_statuses.get(user_id),
+             ConsentStatus.ACTIVE.value, scope.value, ip_address, user_agent, notes)
+            for user_id in user_ids
+        ])
+        
+        conn.commit()
+    
+    return len(user_ids)
+
+
 def revoke_consent(
     user_id: str,
     db_path: str,
@@ -17,9 +17,9 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import json
 from pathlib import Path
-import sqlite3
 from contextlib import contextmanager
 
+from ingest.database import get_pooled_connection
 from personas.persona_definition import PersonaAssignment, PersonaType
 
 # Use TYPE_CHECKING to avoid circular dependency
@@ -98,31 +98,48 @@ class DecisionTrace:
 
 @contextmanager
 def get_connection(db_path: str):
-    """Get database connection context manager."""
+    """Get a pooled database connection context manager."""
     db_location = Path(db_path)
     db_location.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_location)
-    conn.row_factory = sqlite3.Row
+    conn = get_pooled_connection(db_location)
     try:
         yield conn
         conn.commit()
     except Exception:
         conn.rollback()
         raise
-    finally:
-        conn.close()
+
+
+DECISION_TRACE_SCHEMA_OBJECTS = (
+    ("table", "decision_traces"),
+    ("index", "idx_decision_traces_user"),
+    ("index", "idx_decision_traces_review"),
+)
 
 
 def create_decision_trace_tables(db_path: str) -> None:
     """
     Create decision trace tables in the database.
     
+    Skips the DDL entirely when the table and its indexes already exist;
+    otherwise creates them in a single transaction.
+    
     Args:
         db_path: Path to SQLite database
     """
     with get_connection(db_path) as conn:
         cursor = conn.cursor()
         
+        cursor.execute("""
+            SELECT type, name FROM sqlite_master
+            WHERE name IN ('decision_traces', 'idx_decision_traces_user', 'idx_decision_traces_review')
+        """)
+        existing = {(row['type'], row['name']) for row in cursor.fetchall()}
+        if existing.issuperset(DECISION_TRACE_SCHEMA_OBJECTS):
+            return
+        
+        cursor.execute("BEGIN IMMEDIATE")
+        
         # Decision trace table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS decision_traces (
@@ -78,6 +78,7 @@ class AccountBalance:
     utilization_rate: Optional[float] = None  # For credit cards
     days_until_due: Optional[int] = None  # For credit cards
     minimum_payment: Optional[float] = None  # For credit cards
+    apr: Optional[float] = None  # For credit cards with liability data
     is_overdue: bool = False
     
     # Remarks
@@ -191,6 +192,7 @@ def _analyze_account_balance(
     liability = liability_map.get(account.account_id)
     is_overdue = liability.is_overdue if liability else False
     minimum_payment = liability.minimum_payment_amount if liability else None
+    apr = liability.aprs[0].percentage if liability and liability.aprs else None
     days_until_due = None
     
     if liability and liability.next_payment_due_date:
@@ -240,6 +242,7 @@ def _analyze_account_balance(
         utilization_rate=utilization_rate,
         days_until_due=days_until_due,
         minimum_payment=minimum_payment,
+        apr=apr,
         is_overdue=is_overdue,
         remarks=remarks
     )
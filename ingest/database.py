@@ -7,6 +7,8 @@ for accounts, transactions, and liabilities.
 
 import sqlite3
 import json
+import os
+import threading
 from pathlib import Path
 from typing import List, Optional, Dict, Tuple
 from datetime import date, datetime
@@ -99,19 +101,114 @@ def create_database(db_path: str) -> None:
         
         # Create indexes for performance
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_accounts_customer_id ON accounts(customer_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_accounts_updated_date ON accounts(DATE(updated_at), customer_id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_accounts_balance ON accounts(account_id, balances_current)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_account_id ON transactions(account_id)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_customer_id ON transactions(account_id, date)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_transactions_pending ON transactions(pending)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_liabilities_overdue ON credit_card_liabilities(account_id) WHERE is_overdue = 1")
         
         conn.commit()
 
 
+# Per-thread connection cache: {db_path: (file identity, connection)}
+_connection_cache = threading.local()
+
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _file_identity(db_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Identify the file behind a path so a replaced database is not reused.
+    
+    Only the device and inode are used: timestamps change on every commit and
+    checkpoint, which would drop pooled connections for ordinary writes. A
+    replacement file can't reuse the inode while the old connection holds it open.
+    """
+    try:
+        stat = os.stat(db_path)
+    except OSError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+
+def get_pooled_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Get this thread's cached connection for a database, opening it if needed.
+    
+    Connections are opened once per thread in WAL mode and reused across
+    requests. A connection is reopened if the database file has been
+    replaced or the cached connection was closed.
+    
+    Args:
+        db_path: Path to SQLite database file
+        
+    Returns:
+        sqlite3.Connection: Database connection with sqlite3.Row rows
+    """
+    db_path = str(db_path)
+    connections = getattr(_connection_cache, "connections", None)
+    if connections is None:
+        connections = _connection_cache.connections = {}
+    
+    identity = _file_identity(db_path)
+    cached = connections.get(db_path)
+    if cached is not None and identity is not None:
+        cached_identity, conn = cached
+        if cached_identity == identity:
+            try:
+                conn.total_changes  # Raises if the connection was closed
+                return conn
+            except sqlite3.ProgrammingError:
+                pass
+    if cached is not None:
+        connections.pop(db_path)
+        try:
+            cached[1].close()
+        except sqlite3.Error:
+            pass
+    
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row  # Enable column access by name
+    for pragma in CONNECTION_PRAGMAS:
+        try:
+            conn.execute(pragma)
+        except sqlite3.Error:
+            pass
+    
+    # Re-read identity: switching to WAL may have created or touched the file
+    identity = _file_identity(db_path)
+    if identity is not None:
+        connections[db_path] = (identity, conn)
+    return conn
+
+
+def close_pooled_connections() -> None:
+    """Close all cached connections held by the current thread."""
+    connections = getattr(_connection_cache, "connections", None) or {}
+    for _, conn in connections.values():
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+    connections.clear()
+
+
 @contextmanager
 def get_connection(db_path: str):
     """
     Get a database connection with proper context management.
     
+    The connection comes from the per-thread pool and stays open after the
+    block; changes are committed on success and rolled back on error.
+    
     Args:
         db_path: Path to SQLite database file
         
@@ -120,16 +217,13 @@ def get_connection(db_path: str):
     """
     db_location = Path(db_path)
     db_location.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_location)
-    conn.row_factory = sqlite3.Row  # Enable column access by name
+    conn = get_pooled_connection(db_location)
     try:
         yield conn
         conn.commit()
     except Exception:
         conn.rollback()
         raise
-    finally:
-        conn.close()
 
 
 # ============================================================================
@@ -233,6 +327,16 @@ def load_transactions(transactions: List[Transaction], db_path: str) -> int:
         return loaded
 
 
+INSERT_CREDIT_CARD_LIABILITY_SQL = """
+    INSERT OR REPLACE INTO credit_card_liabilities (
+        account_id, apr_type, apr_percentage,
+        minimum_payment_amount, last_payment_amount,
+        is_overdue, next_payment_due_date,
+        last_statement_balance
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def load_credit_card_liabilities(liabilities: List[CreditCardLiability], db_path: str) -> int:
     """
     Load credit card liabilities into database.
@@ -255,14 +359,7 @@ def load_credit_card_liabilities(liabilities: List[CreditCardLiability], db_path
                 if apr is None:
                     continue
                 
-                cursor.execute("""
-                    INSERT OR REPLACE INTO credit_card_liabilities (
-                        account_id, apr_type, apr_percentage,
-                        minimum_payment_amount, last_payment_amount,
-                        is_overdue, next_payment_due_date,
-                        last_statement_balance
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+                cursor.execute(INSERT_CREDIT_CARD_LIABILITY_SQL, (
                     liability.account_id,
                     apr.type,
                     apr.percentage,
@@ -421,6 +518,92 @@ def load_from_csv(
     }
 
 
+# Rows parsed and inserted per chunk when bulk loading from CSV; chunks are
+# parsed column-wise by pandas, so larger chunks amortize its per-chunk overhead
+CSV_INSERT_BATCH_SIZE = 10_000
+
+# Liabilities CSV columns in INSERT_CREDIT_CARD_LIABILITY_SQL order, with the
+# values used for empty or missing fields
+LIABILITY_CSV_COLUMNS = (
+    'account_id', 'apr_type', 'apr_percentage',
+    'minimum_payment_amount', 'last_payment_amount',
+    'is_overdue', 'next_payment_due_date',
+    'last_statement_balance'
+)
+LIABILITY_CSV_DEFAULTS = {
+    'apr_type': 'purchase_apr',
+    'apr_percentage': 0.0,
+    'minimum_payment_amount': 0.0,
+    'is_overdue': 0
+}
+
+# Multi-row form of INSERT_CREDIT_CARD_LIABILITY_SQL used for bulk loads, so
+# each statement step writes several rows
+LIABILITY_ROWS_PER_INSERT = 50
+INSERT_CREDIT_CARD_LIABILITIES_SQL = INSERT_CREDIT_CARD_LIABILITY_SQL.replace(
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+    "VALUES " + ", ".join(["(?, ?, ?, ?, ?, ?, ?, ?)"] * LIABILITY_ROWS_PER_INSERT)
+)
+
+
+def load_liabilities_csv(liabilities_csv: str, db_path: str, replace: bool = False) -> int:
+    """
+    Bulk load credit card liabilities straight from a CSV file.
+    
+    The file is parsed by pandas in chunks of CSV_INSERT_BATCH_SIZE rows, with
+    numeric columns coerced column-wise, and each chunk is inserted
+    LIABILITY_ROWS_PER_INSERT rows per statement within a single transaction.
+    
+    Args:
+        liabilities_csv: Path to liabilities CSV file
+        db_path: Path to SQLite database file
+        replace: Delete existing liabilities in the same transaction first
+        
+    Returns:
+        Number of liabilities loaded
+    """
+    import pandas as pd
+    
+    columns = list(LIABILITY_CSV_COLUMNS)
+    reader = pd.read_csv(
+        liabilities_csv,
+        usecols=lambda column: column in LIABILITY_CSV_COLUMNS,
+        dtype={'account_id': str, 'apr_type': str, 'next_payment_due_date': str},
+        keep_default_na=False,
+        na_values=[''],
+        chunksize=CSV_INSERT_BATCH_SIZE
+    )
+    
+    with get_connection(db_path) as conn, reader as chunks:
+        cursor = conn.cursor()
+        if replace:
+            cursor.execute("DELETE FROM credit_card_liabilities")
+        
+        loaded = 0
+        for chunk in chunks:
+            chunk = chunk.reindex(columns=columns).fillna(LIABILITY_CSV_DEFAULTS)
+            chunk['is_overdue'] = chunk['is_overdue'].astype(int)
+            # Plain Python values, with remaining gaps as NULL
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            
+            # Whole groups of rows go through the multi-row statement, the rest one by one
+            values = chunk.to_numpy().ravel().tolist()
+            grouped = len(chunk) - len(chunk) % LIABILITY_ROWS_PER_INSERT
+            step = LIABILITY_ROWS_PER_INSERT * len(columns)
+            cursor.executemany(
+                INSERT_CREDIT_CARD_LIABILITIES_SQL,
+                (values[i:i + step] for i in range(0, grouped * len(columns), step))
+            )
+            cursor.executemany(
+                INSERT_CREDIT_CARD_LIABILITY_SQL,
+                chunk.iloc[grouped:].itertuples(index=False, name=None)
+            )
+            loaded += len(chunk)
+        
+        conn.commit()
+        return loaded
+
+
 def load_from_json(json_path: str, db_path: str) -> Dict[str, int]:
     """
     Load data from JSON file into database.
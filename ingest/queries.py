@@ -5,11 +5,13 @@ This module provides query functions for retrieving accounts, transactions,
 and liabilities from the SQLite database.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date
 from contextlib import contextmanager
-import sqlite3
+from bisect import bisect_left
+import time
 
+from .database import get_pooled_connection
 from .schemas import (
     Account, Transaction, CreditCardLiability, LoanLiability,
     AccountType, AccountSubtype, HolderCategory, PaymentChannel,
@@ -20,17 +22,14 @@ from .schemas import (
 
 @contextmanager
 def get_connection(db_path: str):
-    """Get a database connection with proper context management."""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
+    """Get a pooled database connection with proper context management."""
+    conn = get_pooled_connection(db_path)
     try:
         yield conn
         conn.commit()
     except Exception:
         conn.rollback()
         raise
-    finally:
-        conn.close()
 
 
 def get_accounts_by_customer(customer_id: str, db_path: str) -> List[Account]:
@@ -304,10 +303,62 @@ def get_all_customers(db_path: str, limit: Optional[int] = None) -> List[str]:
     with get_connection(db_path) as conn:
         cursor = conn.cursor()
         query = "SELECT DISTINCT customer_id FROM accounts ORDER BY customer_id"
+        params = []
         if limit:
-            query += f" LIMIT {limit}"
-        cursor.execute(query)
-        return [row['customer_id'] for row in cursor.fetchall()]
+            query += " LIMIT ?"
+            params.append(limit)
+        cursor.execute(query, params)
+        return [customer_id for (customer_id,) in cursor.fetchall()]
+
+
+def has_accounts(db_path: str) -> bool:
+    """
+    Check whether the database holds any accounts (i.e. has been seeded).
+    
+    Stops at the first row instead of counting the whole table.
+    
+    Args:
+        db_path: Path to SQLite database file
+        
+    Returns:
+        True if at least one account exists
+    """
+    with get_connection(db_path) as conn:
+        return bool(conn.execute("SELECT EXISTS (SELECT 1 FROM accounts)").fetchone()[0])
+
+
+# Customer IDs change on ingest timescales, so polled endpoints share a short-lived copy
+CUSTOMER_IDS_TTL_SECONDS = 60.0
+_customer_ids_cache: Dict[Tuple[str, Optional[int]], Tuple[float, Tuple[str, ...]]] = {}
+
+
+def get_customer_ids(db_path: str, limit: Optional[int] = None) -> Tuple[str, ...]:
+    """
+    Get customer IDs, served from a short-lived cache.
+    
+    Returns an immutable tuple so cached results can be shared without copying.
+    
+    Args:
+        db_path: Path to SQLite database file
+        limit: Optional limit on number of customers
+        
+    Returns:
+        Tuple of customer IDs
+    """
+    key = (db_path, limit)
+    now = time.monotonic()
+    cached = _customer_ids_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    customer_ids = tuple(get_all_customers(db_path, limit))
+    _customer_ids_cache[key] = (now + CUSTOMER_IDS_TTL_SECONDS, customer_ids)
+    return customer_ids
+
+
+def clear_customer_ids_cache() -> None:
+    """Drop cached customer IDs (call after customers are added or reloaded)."""
+    _customer_ids_cache.clear()
 
 
 def search_customers(db_path: str, query: str, limit: int = 10) -> List[str]:
@@ -338,6 +389,62 @@ def search_customers(db_path: str, query: str, limit: int = 10) -> List[str]:
         return [row['customer_id'] for row in cursor.fetchall()]
 
 
+class CustomerSearchIndex:
+    """
+    In-memory index of customer IDs for autocomplete lookups.
+    
+    Prefix matches are found with a binary search over the sorted IDs; when
+    they don't fill the requested limit, the remaining slots are filled with
+    case-insensitive substring matches (the same rule as search_customers).
+    """
+    
+    def __init__(self, customer_ids: List[str]):
+        self._ids = sorted(customer_ids)
+        self._keys = [customer_id.lower() for customer_id in self._ids]
+    
+    @classmethod
+    def from_database(cls, db_path: str) -> "CustomerSearchIndex":
+        """Build the index from the customer IDs currently in the database."""
+        return cls(get_all_customers(db_path))
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def search(self, query: str, limit: int = 10) -> List[str]:
+        """
+        Search the index for customer IDs matching a query.
+        
+        Args:
+            query: Search query (partial customer ID)
+            limit: Maximum number of results
+            
+        Returns:
+            List of matching customer IDs, prefix matches first
+        """
+        if not query or limit <= 0:
+            return []
+        
+        needle = query.lower()
+        matches = []
+        
+        index = bisect_left(self._keys, needle)
+        while index < len(self._keys) and len(matches) < limit:
+            if not self._keys[index].startswith(needle):
+                break
+            matches.append(self._ids[index])
+            index += 1
+        
+        if len(matches) < limit:
+            seen = set(matches)
+            for key, customer_id in zip(self._keys, self._ids):
+                if needle in key and customer_id not in seen:
+                    matches.append(customer_id)
+                    if len(matches) >= limit:
+                        break
+        
+        return matches
+
+
 def get_customer_summary(db_path: str, customer_id: str) -> Optional[Dict]:
     """
     Get summary information for a customer.
@@ -412,66 +519,97 @@ def get_transactions_summary_by_category(
     Returns:
         Dictionary with category summaries
     """
-    transactions = get_transactions_by_customer(
-        customer_id, db_path,
-        start_date=start_date,
-        end_date=end_date,
-        exclude_pending=True
-    )
-    
-    if not transactions:
-        return {
-            "total_transactions": 0,
-            "total_amount": 0.0,
-            "by_category": {},
-            "by_primary_category": {}
-        }
+    filters = "a.customer_id = ? AND t.pending = 0"
+    params = [customer_id]
     
-    # Group by category
-    by_category = {}
-    by_primary_category = {}
+    if start_date:
+        filters += " AND t.date >= ?"
+        params.append(start_date.isoformat())
     
-    total_amount = 0.0
+    if end_date:
+        filters += " AND t.date <= ?"
+        params.append(end_date.isoformat())
     
-    for transaction in transactions:
-        category_primary = transaction.category.primary.value if transaction.category and transaction.category.primary else "OTHER"
-        category_detailed = transaction.category.detailed.value if transaction.category and transaction.category.detailed else "OTHER"
-        
-        amount = abs(transaction.amount)
-        total_amount += amount
+    # Transactions without a category are bucketed as OTHER at both levels
+    primary_expr = "COALESCE(t.personal_finance_category_primary, 'OTHER')"
+    detailed_expr = """
+        CASE WHEN t.personal_finance_category_primary IS NULL THEN 'OTHER'
+             ELSE COALESCE(t.personal_finance_category_detailed, 'OTHER') END
+    """
+    
+    with get_connection(db_path) as conn:
+        cursor = conn.cursor()
         
-        # Group by detailed category
-        if category_detailed not in by_category:
-            by_category[category_detailed] = {
-                "count": 0,
+        # Aggregate in SQL so only one row per category is returned
+        cursor.execute(f"""
+            SELECT {primary_expr} AS category_primary,
+                   {detailed_expr} AS category_detailed,
+                   COUNT(*) AS count,
+                   SUM(ABS(t.amount)) AS total_amount
+            FROM transactions t
+            JOIN accounts a ON t.account_id = a.account_id
+            WHERE {filters}
+            GROUP BY category_primary, category_detailed
+        """, params)
+        category_rows = cursor.fetchall()
+        
+        if not category_rows:
+            return {
+                "total_transactions": 0,
                 "total_amount": 0.0,
-                "average_amount": 0.0,
-                "transactions": []
+                "by_category": {},
+                "by_primary_category": {}
             }
-        by_category[category_detailed]["count"] += 1
-        by_category[category_detailed]["total_amount"] += amount
-        by_category[category_detailed]["transactions"].append({
-            "date": transaction.date.isoformat(),
-            "amount": amount,
-            "merchant": transaction.merchant_name or "Unknown"
-        })
         
-        # Group by primary category
-        if category_primary not in by_primary_category:
-            by_primary_category[category_primary] = {
-                "count": 0,
-                "total_amount": 0.0
-            }
-        by_primary_category[category_primary]["count"] += 1
-        by_primary_category[category_primary]["total_amount"] += amount
+        # Per-category listings only need three columns, not full Transaction models
+        cursor.execute(f"""
+            SELECT {detailed_expr} AS category_detailed,
+                   t.date, ABS(t.amount) AS amount,
+                   COALESCE(t.merchant_name, 'Unknown') AS merchant
+            FROM transactions t
+            JOIN accounts a ON t.account_id = a.account_id
+            WHERE {filters}
+            ORDER BY t.date DESC, t.transaction_id
+        """, params)
+        transaction_rows = cursor.fetchall()
+    
+    by_category = {}
+    by_primary_category = {}
+    total_transactions = 0
+    total_amount = 0.0
+    
+    for row in category_rows:
+        total_transactions += row['count']
+        total_amount += row['total_amount']
+        
+        detailed = by_category.setdefault(row['category_detailed'], {
+            "count": 0,
+            "total_amount": 0.0,
+            "average_amount": 0.0,
+            "transactions": []
+        })
+        detailed["count"] += row['count']
+        detailed["total_amount"] += row['total_amount']
+        
+        primary = by_primary_category.setdefault(
+            row['category_primary'], {"count": 0, "total_amount": 0.0}
+        )
+        primary["count"] += row['count']
+        primary["total_amount"] += row['total_amount']
     
     # Calculate averages
     for cat in by_category.values():
-        if cat["count"] > 0:
-            cat["average_amount"] = cat["total_amount"] / cat["count"]
+        cat["average_amount"] = cat["total_amount"] / cat["count"]
+    
+    for row in transaction_rows:
+        by_category[row['category_detailed']]["transactions"].append({
+            "date": row['date'],
+            "amount": row['amount'],
+            "merchant": row['merchant']
+        })
     
     return {
-        "total_transactions": len(transactions),
+        "total_transactions": total_transactions,
         "total_amount": total_amount,
         "by_category": by_category,
         "by_primary_category": by_primary_category
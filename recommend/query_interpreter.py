@@ -3,12 +3,12 @@ Natural Language Query Interpreter for SpendSenseAI
 Interprets natural language queries and executes database operations
 """
 
-import sqlite3
 import re
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 from features.subscription_detection import detect_subscriptions_for_customer
+from ingest.database import get_pooled_connection
 
 # Try to import SQL query generator (optional, requires LLM)
 try:
@@ -18,6 +18,19 @@ except ImportError:
     SQL_GENERATOR_AVAILABLE = False
 
 
+# Customer ID patterns, compiled once at import
+CUSTOMER_ID_PATTERN = re.compile(r'CUST\d+', re.IGNORECASE)
+CUSTOMER_NUMBER_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'customer\s*(\d+)',
+        r'cust\s*(\d+)',
+        r'user\s*(\d+)',
+        r'c\s*(\d+)',
+    )
+)
+
+
 class QueryInterpreter:
     """Interprets natural language queries into database operations"""
     
@@ -153,21 +166,14 @@ class QueryInterpreter:
     def _extract_customer_id(self, query: str) -> Optional[str]:
         """Extract customer ID from query"""
         # Match CUST followed by digits (e.g., CUST000001)
-        match = re.search(r'CUST\d+', query, re.IGNORECASE)
+        match = CUSTOMER_ID_PATTERN.search(query)
         if match:
             return match.group(0).upper()
         
         # Match variations like "customer1", "customer 1", "cust1", "user1", etc.
         # Extract the number and format as CUST000001
-        patterns = [
-            r'customer\s*(\d+)',
-            r'cust\s*(\d+)',
-            r'user\s*(\d+)',
-            r'c\s*(\d+)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, query, re.IGNORECASE)
+        for pattern in CUSTOMER_NUMBER_PATTERNS:
+            match = pattern.search(query)
             if match:
                 num = match.group(1)
                 # Format as CUST000001 (pad with zeros)
@@ -177,8 +183,7 @@ class QueryInterpreter:
     
     def _list_customers(self) -> Dict[str, Any]:
         """List all customers"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_pooled_connection(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -189,7 +194,6 @@ class QueryInterpreter:
         """)
         
         customers = [row['customer_id'] for row in cursor.fetchall()]
-        conn.close()
         
         return {
             'success': True,
@@ -204,8 +208,7 @@ class QueryInterpreter:
     
     def _get_customer_info(self, customer_id: str) -> Dict[str, Any]:
         """Get customer information"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_pooled_connection(self.db_path)
         cursor = conn.cursor()
         
         # Get account count
@@ -216,7 +219,6 @@ class QueryInterpreter:
         cursor.execute("SELECT COUNT(*) as count FROM transactions WHERE customer_id = ?", (customer_id,))
         transaction_count = cursor.fetchone()['count']
         
-        conn.close()
         
         return {
             'success': True,
@@ -232,8 +234,7 @@ class QueryInterpreter:
     
     def _get_balances(self, customer_id: str) -> Dict[str, Any]:
         """Get balance information for a customer"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_pooled_connection(self.db_path)
         cursor = conn.cursor()
         
         # Get assets (depository accounts)
@@ -254,7 +255,6 @@ class QueryInterpreter:
         
         net_worth = total_assets - total_debts
         
-        conn.close()
         
         return {
             'success': True,
@@ -271,8 +271,7 @@ class QueryInterpreter:
     
     def _get_debt_info(self, customer_id: str) -> Dict[str, Any]:
         """Get debt information for a customer"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_pooled_connection(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -307,7 +306,6 @@ class QueryInterpreter:
             total_debt += debt_amount
             total_limit += limit
         
-        conn.close()
         
         return {
             'success': True,
@@ -373,8 +371,7 @@ class QueryInterpreter:
     
     def _get_transactions(self, customer_id: str) -> Dict[str, Any]:
         """Get recent transactions"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_pooled_connection(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -406,7 +403,6 @@ class QueryInterpreter:
                 'category': category
             })
         
-        conn.close()
         
         return {
             'success': True,
@@ -422,8 +418,7 @@ class QueryInterpreter:
     
     def _get_overdue_info(self, customer_id: str) -> Dict[str, Any]:
         """Get overdue credit card information for a customer"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_pooled_connection(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -452,7 +447,6 @@ class QueryInterpreter:
                 'next_payment_due_date': row['next_payment_due_date']
             })
         
-        conn.close()
         
         return {
             'success': True,
@@ -468,8 +462,7 @@ class QueryInterpreter:
     
     def _count_overdue_customers(self) -> Dict[str, Any]:
         """Count customers with overdue credit card balances"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_pooled_connection(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -482,7 +475,6 @@ class QueryInterpreter:
         result = cursor.fetchone()
         count = result['count'] if result else 0
         
-        conn.close()
         
         return {
             'success': True,
@@ -497,8 +489,7 @@ class QueryInterpreter:
     
     def _list_overdue_customers(self) -> Dict[str, Any]:
         """List customers with overdue credit card balances"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = get_pooled_connection(self.db_path)
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -521,7 +512,6 @@ class QueryInterpreter:
                 'total_overdue_balance': round(row['total_overdue_balance'] or 0, 2)
             })
         
-        conn.close()
         
         return {
             'success': True,
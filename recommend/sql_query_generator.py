@@ -13,6 +13,7 @@ from datetime import datetime
 import logging
 
 from recommend.llm_generator import LLMTextGenerator, LLMConfig
+from ingest.database import get_pooled_connection
 
 # Database schema information for LLM context
 DATABASE_SCHEMA = """
@@ -265,12 +266,10 @@ Remember:
         
         # Try to parse the SQL (basic validation)
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = get_pooled_connection(self.db_path).cursor()
             # Use EXPLAIN to validate without executing
             cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
             cursor.fetchall()
-            conn.close()
         except sqlite3.Error as e:
             return {
                 'valid': False,
@@ -310,9 +309,7 @@ Remember:
         
         # Execute query
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            cursor = get_pooled_connection(self.db_path).cursor()
             
             if parameters:
                 cursor.execute(sql_query, parameters)
@@ -327,8 +324,6 @@ Remember:
             for row in rows:
                 results.append(dict(row))
             
-            conn.close()
-            
             return {
                 'success': True,
                 'query': natural_language_query,
@@ -14,12 +14,19 @@ import pytest
 from fastapi.testclient import TestClient
 from datetime import datetime
 import tempfile
+import threading
 import os
 
-from ui.api import app
+from starlette.requests import Request
+
+from ui.api import (
+    app, cacheable_response, ensure_schema, ORJSONResponse, TTLCache, _dashboard_db_snapshot,
+    SCHEMA_VERSION
+)
 from guardrails.consent import create_consent_tables
 from guardrails.decision_trace import create_decision_trace_tables
-from ingest.database import create_database
+from ingest.database import create_database, get_connection
+from eval.effectiveness_tracking import create_effectiveness_tables
 
 # Create test client
 client = TestClient(app)
@@ -185,6 +192,254 @@ class TestOperatorEndpoints:
         assert response.status_code in [404, 500]
 
 
+class TestResponseCaching:
+    """Test ETag/Cache-Control handling for cacheable GETs."""
+    
+    def _request(self, headers=None):
+        """Build a bare GET request with optional headers."""
+        raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+        return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+    
+    def test_etag_and_cache_control(self):
+        """Test responses carry an ETag and max-age."""
+        response = cacheable_response(self._request(), {"suggestions": ["CUST000001"]}, max_age=10)
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "private, max-age=10"
+        assert response.headers["etag"].startswith('W/"')
+    
+    def test_if_none_match(self):
+        """Test matching If-None-Match returns 304 and a stale one does not."""
+        etag = cacheable_response(self._request(), {"count": 1}, max_age=10).headers["etag"]
+        
+        cached = cacheable_response(self._request({"If-None-Match": etag}), {"count": 1}, max_age=10)
+        assert cached.status_code == 304
+        
+        changed = cacheable_response(self._request({"If-None-Match": etag}), {"count": 2}, max_age=10)
+        assert changed.status_code == 200
+    
+    def test_rendered_response(self):
+        """Test an already rendered response gets the same ETag as its content."""
+        etag = cacheable_response(self._request(), {"count": 1}, max_age=10).headers["etag"]
+        
+        response = cacheable_response(self._request(), ORJSONResponse({"count": 1}), max_age=10)
+        assert response.headers["etag"] == etag
+
+    
+    def test_etag_key(self):
+        """Test a summary key keeps the ETag stable while volatile fields change."""
+        etag = cacheable_response(
+            self._request(), {"timestamp": 1, "status": "healthy"}, max_age=5, etag_key=("healthy",)
+        ).headers["etag"]
+        
+        cached = cacheable_response(
+            self._request({"If-None-Match": etag}), {"timestamp": 2, "status": "healthy"},
+            max_age=5, etag_key=("healthy",)
+        )
+        assert cached.status_code == 304
+        
+        changed = cacheable_response(
+            self._request({"If-None-Match": etag}), {"timestamp": 3, "status": "degraded"},
+            max_age=5, etag_key=("degraded",)
+        )
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+
+class TestTTLCache:
+    """Test the in-process TTL LRU cache."""
+    
+    def test_expired_entries_are_dropped(self):
+        """Test entries are not served after their TTL."""
+        cache = TTLCache(ttl_seconds=0.0, max_entries=10)
+        cache.set("CUST000001", "profile")
+        
+        assert cache.get("CUST000001") is None
+        assert len(cache) == 0
+    
+    def test_least_recently_used_evicted(self):
+        """Test the oldest unused entry is evicted past max_entries."""
+        cache = TTLCache(ttl_seconds=60.0, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+    
+    def test_pop_user(self):
+        """Test all keys for one user are dropped."""
+        cache = TTLCache(ttl_seconds=60.0, max_entries=10)
+        cache.set("CUST000001", 1)
+        cache.set(("CUST000001", 3), 2)
+        cache.set(("CUST000002", 3), 3)
+        
+        cache.pop_user("CUST000001")
+        
+        assert len(cache) == 1
+        assert cache.get(("CUST000002", 3)) == 3
+    
+    def test_invalidation_from_threads(self):
+        """Test clears from worker threads don't break concurrent reads and writes."""
+        cache = TTLCache(ttl_seconds=60.0, max_entries=64)
+        stop = threading.Event()
+        
+        def invalidate():
+            while not stop.is_set():
+                cache.pop_user("CUST000001")
+                cache.clear()
+        
+        workers = [threading.Thread(target=invalidate) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        try:
+            for i in range(20000):
+                cache.set(("CUST000001", i % 100), i)
+                cache.get(("CUST000001", (i - 1) % 100))
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+
+class TestDashboardSnapshot:
+    """Test the health dashboard activity counts."""
+    
+    def _add_account(self, db_path):
+        with get_connection(db_path) as conn:
+            conn.execute("""
+                INSERT INTO accounts (account_id, customer_id, type, subtype, balances_current)
+                VALUES ('ACC-1', 'CUST000001', 'depository', 'checking', 100.0)
+            """)
+    
+    def test_single_query(self, temp_db):
+        """Test counts are read when all tables exist."""
+        create_effectiveness_tables(temp_db)
+        self._add_account(temp_db)
+        today = datetime.now().date()
+        
+        snapshot = _dashboard_db_snapshot(temp_db, today, today)
+        
+        assert snapshot["total_accounts"] == 1
+        assert snapshot["total_transactions"] == 0
+        assert snapshot["recommendations_today"] == 0
+        assert snapshot["latest_transaction"] is None
+    
+    def test_missing_table_falls_back(self, temp_db):
+        """Test a missing engagement table only zeroes its own count."""
+        self._add_account(temp_db)
+        today = datetime.now().date()
+        
+        snapshot = _dashboard_db_snapshot(temp_db, today, today)
+        
+        assert snapshot["total_accounts"] == 1
+        assert snapshot["recommendations_today"] == 0
+        assert snapshot["consent_today"] == 0
+    
+    def test_activity_only(self, temp_db):
+        """Test table sizes are skipped when the caller already has them."""
+        today = datetime.now().date()
+        
+        snapshot = _dashboard_db_snapshot(temp_db, today, today, include_table_stats=False)
+        
+        assert set(snapshot) == {"active_today", "active_week", "recommendations_today", "consent_today"}
+
+
+class TestCustomerIndex:
+    """Test the customer search index lifetime."""
+    
+    def test_stale_index_rebuilt(self, temp_db, monkeypatch):
+        """Test customers loaded outside the API appear once the index expires."""
+        import ui.api
+        monkeypatch.setattr(ui.api, "DB_PATH", temp_db)
+        monkeypatch.setattr(ui.api, "_customer_index", None)
+        monkeypatch.setattr(ui.api, "CUSTOMER_IDS_TTL_SECONDS", 0.0)
+        assert len(ui.api.get_customer_index()) == 0
+        
+        with get_connection(temp_db) as conn:
+            conn.execute("""
+                INSERT INTO accounts (account_id, customer_id, type, subtype, balances_current)
+                VALUES ('ACC-1', 'CUST000001', 'depository', 'checking', 100.0)
+            """)
+        
+        assert ui.api.get_customer_index().search("CUST") == ["CUST000001"]
+    
+    def test_fresh_index_reused(self, temp_db, monkeypatch):
+        """Test the index is not rebuilt within its TTL."""
+        import ui.api
+        monkeypatch.setattr(ui.api, "DB_PATH", temp_db)
+        monkeypatch.setattr(ui.api, "_customer_index", None)
+        
+        assert ui.api.get_customer_index() is ui.api.get_customer_index()
+
+
+class TestLogListener:
+    """Test queued logging keeps the configured handlers."""
+    
+    def test_records_reach_root_handlers(self):
+        """Test records are formatted by the root handlers and still propagate."""
+        import logging
+        import ui.api
+        records = []
+        handler = logging.Handler()
+        handler.emit = lambda record: records.append(handler.format(record))
+        handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        root = logging.getLogger()
+        root.addHandler(handler)
+        try:
+            ui.api.start_log_listener()
+            ui.api.logger.warning("queued")
+            ui.api.stop_log_listener()
+        finally:
+            root.removeHandler(handler)
+        
+        assert records == ["WARNING queued"]
+        assert ui.api.logger.propagate is True
+        assert handler not in root.handlers
+
+
+class TestEnsureSchema:
+    """Test schema setup at startup."""
+    
+    def test_schema_version_recorded(self, temp_db):
+        """Test tables are created once and the version is stored."""
+        ensure_schema(temp_db)
+        
+        with get_connection(temp_db) as conn:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert {"accounts", "consent", "recommendation_engagement"} <= tables
+    
+    def test_current_schema_skipped(self, temp_db):
+        """Test a database already at the current version is left alone."""
+        with get_connection(temp_db) as conn:
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        
+        ensure_schema(temp_db)
+        
+        with get_connection(temp_db) as conn:
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        assert "recommendation_engagement" not in tables
+
+
+class TestErrorHandling:
+    """Test unhandled errors are reported as JSON."""
+    
+    def test_unhandled_error(self, monkeypatch, tmp_path):
+        """Test an admin endpoint failure returns a JSON 500 without a traceback."""
+        import ui.api
+        monkeypatch.setattr(ui.api, "DB_PATH", str(tmp_path / "empty.db"))
+        
+        response = TestClient(app, raise_server_exceptions=False).post("/admin/recalculate-overdue")
+        
+        assert response.status_code == 500
+        data = response.json()
+        assert data["status"] == "error"
+        assert "credit_card_liabilities" in data["message"]
+        assert "traceback" not in data
+
+
 class TestAPIDocumentation:
     """Test API documentation."""
     
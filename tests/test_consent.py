@@ -18,7 +18,7 @@ from pathlib import Path
 
 from guardrails.consent import (
     ConsentStatus, ConsentScope, ConsentRecord, ConsentAuditEntry,
-    create_consent_tables, grant_consent, revoke_consent,
+    create_consent_tables, grant_consent, grant_consent_bulk, revoke_consent,
     get_consent, verify_consent, get_consent_audit_trail,
     get_all_consents_for_user
 )
@@ -80,6 +80,19 @@ class TestGrantConsent:
         assert len(audit_trail) > 0
         assert audit_trail[0].action == 'granted'
         assert audit_trail[0].new_status == ConsentStatus.ACTIVE
+    
+    def test_grant_consent_bulk(self, temp_db):
+        """Test bulk granting matches per-user grants, including the audit trail."""
+        grant_consent("USER_A", temp_db, ConsentScope.ALL)
+        revoke_consent("USER_A", temp_db, ConsentScope.ALL)
+        
+        count = grant_consent_bulk(["USER_A", "USER_B", "USER_B"], temp_db, ConsentScope.ALL)
+        
+        assert count == 2
+        assert verify_consent("USER_A", temp_db, ConsentScope.ALL)[0] is True
+        assert verify_consent("USER_B", temp_db, ConsentScope.ALL)[0] is True
+        assert get_consent_audit_trail("USER_A", temp_db)[0].previous_status == ConsentStatus.REVOKED
+        assert get_consent_audit_trail("USER_B", temp_db)[0].previous_status is None
 
 
 class TestRevokeConsent:
@@ -10,7 +10,7 @@ from pathlib import Path
 
 from ingest.database import (
     create_database, load_accounts, load_transactions,
-    load_credit_card_liabilities, check_data_integrity
+    load_credit_card_liabilities, load_liabilities_csv
 )
 from ingest.queries import (
     get_accounts_by_customer, get_transactions_by_account,
@@ -174,8 +174,9 @@ class TestDataLoading:
         # Verify accounts were loaded
         accounts = get_accounts_by_customer("CUST-001", temp_db)
         assert len(accounts) == 2
-        assert accounts[0].account_id == "ACC-001"
-        assert accounts[1].account_id == "ACC-002"
+        # Ordered by type, so the credit card comes before checking
+        assert accounts[0].account_id == "ACC-002"
+        assert accounts[1].account_id == "ACC-001"
     
     def test_load_transactions(self, temp_db, sample_accounts, sample_transactions):
         """Test loading transactions."""
@@ -203,6 +204,27 @@ class TestDataLoading:
         assert len(liabilities) == 1
         assert liabilities[0].account_id == "ACC-002"
         assert liabilities[0].aprs[0].percentage == 18.99
+    
+    def test_load_liabilities_csv(self, temp_db, sample_accounts, sample_liabilities, tmp_path):
+        """Test bulk loading liabilities from CSV, replacing existing rows."""
+        load_accounts(sample_accounts, temp_db)
+        load_credit_card_liabilities(sample_liabilities, temp_db)
+        
+        csv_path = tmp_path / "liabilities.csv"
+        csv_path.write_text(
+            "account_id,apr_type,apr_percentage,minimum_payment_amount,last_payment_amount,"
+            "is_overdue,next_payment_due_date,last_statement_balance\n"
+            "ACC-003,purchase_apr,24.5,35.0,,1,2024-02-01,1200.0\n"
+        )
+        
+        count = load_liabilities_csv(str(csv_path), temp_db, replace=True)
+        assert count == 1
+        
+        assert get_credit_card_liabilities_by_customer("CUST-001", temp_db) == []
+        liabilities = get_credit_card_liabilities_by_customer("CUST-002", temp_db)
+        assert len(liabilities) == 1
+        assert liabilities[0].is_overdue is True
+        assert liabilities[0].last_payment_amount is None
 
 
 class TestQueries:
@@ -0,0 +1,176 @@
+"""
+Unit tests for database query helpers.
+"""
+
+import pytest
+import sqlite3
+import tempfile
+import os
+
+from ingest.database import create_database, get_connection, get_pooled_connection
+from ingest.queries import (
+    CustomerSearchIndex, search_customers, get_transactions_summary_by_category,
+    get_customer_ids, clear_customer_ids_cache, has_accounts
+)
+
+
+@pytest.fixture
+def temp_db():
+    """Create temporary database with a few customers."""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    os.close(fd)
+
+    create_database(path)
+    with get_connection(path) as conn:
+        cursor = conn.cursor()
+        for customer_id in ["CUST000002", "CUST000010", "CUST000001", "ACME000100"]:
+            cursor.execute("""
+                INSERT INTO accounts (account_id, customer_id, type, subtype, balances_current)
+                VALUES (?, ?, 'depository', 'checking', 100.0)
+            """, (f"ACC-{customer_id}", customer_id))
+
+    yield path
+
+    os.unlink(path)
+
+
+class TestCustomerSearchIndex:
+    """Test in-memory customer search index."""
+
+    def test_prefix_search(self):
+        """Test prefix matches are returned in sorted order."""
+        index = CustomerSearchIndex(["CUST000002", "CUST000001", "ACME000100"])
+
+        assert index.search("CUST") == ["CUST000001", "CUST000002"]
+        assert index.search("cust", limit=1) == ["CUST000001"]
+
+    def test_substring_fallback(self):
+        """Test non-prefix queries still match substrings."""
+        index = CustomerSearchIndex(["CUST000002", "CUST000001", "ACME000100"])
+
+        assert index.search("0001") == ["ACME000100", "CUST000001"]
+        assert index.search("A", limit=2) == ["ACME000100"]
+
+    def test_prefix_matches_rank_first(self):
+        """Test prefix matches come before other substring matches."""
+        index = CustomerSearchIndex(["ACME000100", "CUST000100"])
+
+        assert index.search("CUST") == ["CUST000100"]
+        assert index.search("C") == ["CUST000100", "ACME000100"]
+
+    def test_empty_query(self):
+        """Test empty query returns no suggestions."""
+        index = CustomerSearchIndex(["CUST000001"])
+
+        assert index.search("") == []
+        assert index.search("CUST", limit=0) == []
+
+    def test_matches_database_search(self, temp_db):
+        """Test index returns the same customers as the SQL search."""
+        index = CustomerSearchIndex.from_database(temp_db)
+
+        assert len(index) == 4
+        assert index.search("CUST00000") == search_customers(temp_db, "CUST00000")
+
+
+class TestCustomerIdsCache:
+    """Test cached customer ID lookups."""
+
+    def test_cached_until_cleared(self, temp_db):
+        """Test new customers appear only after the cache is cleared."""
+        clear_customer_ids_cache()
+        assert get_customer_ids(temp_db, limit=2) == ("ACME000100", "CUST000001")
+
+        with get_connection(temp_db) as conn:
+            conn.execute("""
+                INSERT INTO accounts (account_id, customer_id, type, subtype, balances_current)
+                VALUES ('ACC-AAAA', 'AAAA000001', 'depository', 'checking', 0.0)
+            """)
+
+        assert get_customer_ids(temp_db, limit=2) == ("ACME000100", "CUST000001")
+        clear_customer_ids_cache()
+        assert get_customer_ids(temp_db, limit=2) == ("AAAA000001", "ACME000100")
+
+
+class TestHasAccounts:
+    """Test the seeded-database check."""
+    
+    def test_has_accounts(self, temp_db):
+        """Test seeded and empty databases are told apart."""
+        assert has_accounts(temp_db) is True
+        
+        with get_connection(temp_db) as conn:
+            conn.execute("DELETE FROM accounts")
+        
+        assert has_accounts(temp_db) is False
+
+
+class TestTransactionsSummaryByCategory:
+    """Test SQL-aggregated transaction summary."""
+
+    def test_summary_by_category(self, temp_db):
+        """Test counts, totals and per-category listings."""
+        with get_connection(temp_db) as conn:
+            cursor = conn.cursor()
+            rows = [
+                ("T1", "2024-01-05", 12.5, "Cafe", "FOOD_AND_DRINK", "RESTAURANTS", 0),
+                ("T2", "2024-01-10", 7.5, None, "FOOD_AND_DRINK", "RESTAURANTS", 0),
+                ("T3", "2024-01-07", -100.0, "Employer", None, None, 0),
+                ("T4", "2024-01-08", 50.0, "Pending", "FOOD_AND_DRINK", "RESTAURANTS", 1),
+            ]
+            for transaction_id, tx_date, amount, merchant, primary, detailed, pending in rows:
+                cursor.execute("""
+                    INSERT INTO transactions (
+                        transaction_id, account_id, date, amount, merchant_name,
+                        personal_finance_category_primary, personal_finance_category_detailed, pending
+                    ) VALUES (?, 'ACC-CUST000001', ?, ?, ?, ?, ?, ?)
+                """, (transaction_id, tx_date, amount, merchant, primary, detailed, pending))
+
+        summary = get_transactions_summary_by_category("CUST000001", temp_db)
+
+        assert summary["total_transactions"] == 3
+        assert summary["total_amount"] == pytest.approx(120.0)
+        restaurants = summary["by_category"]["RESTAURANTS"]
+        assert restaurants["count"] == 2
+        assert restaurants["average_amount"] == pytest.approx(10.0)
+        assert [t["merchant"] for t in restaurants["transactions"]] == ["Unknown", "Cafe"]
+        assert summary["by_category"]["OTHER"]["total_amount"] == pytest.approx(100.0)
+        assert summary["by_primary_category"]["FOOD_AND_DRINK"]["count"] == 2
+
+    def test_empty_summary(self, temp_db):
+        """Test customer with no transactions."""
+        summary = get_transactions_summary_by_category("CUST000002", temp_db)
+
+        assert summary["total_transactions"] == 0
+        assert summary["by_category"] == {}
+
+
+class TestPooledConnection:
+    """Test per-thread connection reuse."""
+
+    def test_connection_reused(self, temp_db):
+        """Test the same connection is returned for an unchanged database."""
+        assert get_pooled_connection(temp_db) is get_pooled_connection(temp_db)
+
+    def test_replaced_database_reopened(self, temp_db):
+        """Test a recreated database file is not served from a stale connection."""
+        conn = get_pooled_connection(temp_db)
+        os.unlink(temp_db)
+        create_database(temp_db)
+
+        assert get_pooled_connection(temp_db) is not conn
+        assert search_customers(temp_db, "CUST") == []
+
+    def test_connection_kept_after_write(self, temp_db):
+        """Test writes from another connection don't drop the pooled connection."""
+        conn = get_pooled_connection(temp_db)
+        writer = sqlite3.connect(temp_db)
+        with writer:
+            writer.execute("""
+                INSERT INTO accounts (account_id, customer_id, type, subtype, balances_current)
+                VALUES ('ACC-NEW', 'NEW0000001', 'depository', 'checking', 0.0)
+            """)
+        writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        writer.close()
+
+        assert get_pooled_connection(temp_db) is conn
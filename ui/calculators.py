@@ -73,24 +73,25 @@ def calculate_credit_payoff(
     # Calculate monthly interest
     monthly_interest_rate = apr / 12 / 100
     
-    # Calculate months to pay off (simplified - assumes fixed payment)
-    # Using amortization formula approximation
+    # Calculate months to pay off with the amortization closed form: with a
+    # fixed payment P the balance after n months is
+    # B(1+r)^n - P((1+r)^n - 1)/r, solved for n at the target balance
     if monthly_payment > (current_balance * monthly_interest_rate):
         # Payment exceeds interest, balance will decrease
-        principal_payment = monthly_payment - (current_balance * monthly_interest_rate)
-        
-        # Simple linear approximation (more accurate would use amortization formula)
-        months_to_target = ceil(balance_reduction_needed / principal_payment) if principal_payment > 0 else None
-        
-        if months_to_target:
-            total_interest = sum(
-                (current_balance - i * principal_payment) * monthly_interest_rate
-                for i in range(min(months_to_target, 100))
+        if monthly_interest_rate > 0:
+            months_to_target = ceil(
+                log((monthly_payment - target_balance * monthly_interest_rate) /
+                    (monthly_payment - current_balance * monthly_interest_rate)) /
+                log(1 + monthly_interest_rate)
             )
-            total_payments = months_to_target * monthly_payment
+            growth = (1 + monthly_interest_rate) ** months_to_target
+            ending_balance = current_balance * growth - monthly_payment * (growth - 1) / monthly_interest_rate
         else:
-            total_interest = 0
-            total_payments = 0
+            months_to_target = ceil(balance_reduction_needed / monthly_payment)
+            ending_balance = current_balance - months_to_target * monthly_payment
+        
+        total_payments = months_to_target * monthly_payment
+        total_interest = total_payments - (current_balance - ending_balance)
     else:
         months_to_target = None
         total_interest = 0
@@ -227,17 +228,22 @@ def calculate_subscription_savings(
     Returns:
         CalculatorResult object
     """
-    total_monthly_savings = 0.0
-    canceled_subscriptions = []
+    # Hashed lookups keep the filter linear in the number of subscriptions
+    # (a list scan per subscription gets quadratic past a couple dozen names)
+    cancel_set = frozenset(subscriptions_to_cancel)
     
-    for subscription in subscriptions:
-        if subscription.get('merchant_name') in subscriptions_to_cancel:
-            monthly_spend = subscription.get('monthly_recurring_spend', 0.0)
-            total_monthly_savings += monthly_spend
-            canceled_subscriptions.append({
-                "merchant": subscription.get('merchant_name'),
-                "monthly_savings": monthly_spend
-            })
+    # One filtering pass builds the canceled list; the total is summed in C
+    canceled_subscriptions = [
+        {
+            "merchant": subscription.get('merchant_name'),
+            "monthly_savings": subscription.get('monthly_recurring_spend', 0.0)
+        }
+        for subscription in subscriptions
+        if subscription.get('merchant_name') in cancel_set
+    ]
+    total_monthly_savings = sum(
+        (canceled["monthly_savings"] for canceled in canceled_subscriptions), 0.0
+    )
     
     annual_savings = total_monthly_savings * 12
     five_year_savings = annual_savings * 5
@@ -17,8 +17,6 @@ from datetime import datetime, timedelta
 from enum import Enum
 import json
 from pathlib import Path
-import sqlite3
-from contextlib import contextmanager
 
 from personas.persona_definition import PersonaType
 from ingest.queries import get_accounts_by_customer
@@ -88,21 +86,6 @@ class DataQualityIssue:
     resolved: bool = False
 
 
-@contextmanager
-def get_connection(db_path: str):
-    """Get database connection context manager."""
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
-
-
 def check_database_health(db_path: str) -> Dict[str, Any]:
     """
     Check database health.